@@ -1,8 +1,11 @@
 """
 Health check endpoints
 """
+import asyncio
+import shutil
 from datetime import datetime
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -20,6 +23,9 @@ router = APIRouter()
 queue_service = QueueService()
 storage_service = StorageService()
 
+# Hardware doesn't change while the API is running; keep the first successful probe
+_hardware_acceleration_cache: Optional[List[str]] = None
+
 
 @router.get("/health")
 async def health_check() -> Dict[str, Any]:
@@ -47,70 +53,66 @@ async def detailed_health_check(
         "components": {},
     }
     
-    # Check database
-    try:
-        result = await db.execute(text("SELECT 1"))
-        health_status["components"]["database"] = {
-            "status": "healthy",
-            "type": "postgresql",
-        }
-    except Exception as e:
-        health_status["status"] = "unhealthy"
-        health_status["components"]["database"] = {
-            "status": "unhealthy",
-            "error": str(e),
-        }
-    
-    # Check queue
-    try:
-        queue_health = await queue_service.health_check()
-        health_status["components"]["queue"] = queue_health
-    except Exception as e:
-        health_status["status"] = "unhealthy"
-        health_status["components"]["queue"] = {
-            "status": "unhealthy",
-            "error": str(e),
-        }
-    
-    # Check storage backends
-    try:
-        storage_health = await storage_service.health_check()
-        health_status["components"]["storage"] = storage_health
-    except Exception as e:
-        health_status["status"] = "unhealthy"
-        health_status["components"]["storage"] = {
-            "status": "unhealthy",
-            "error": str(e),
-        }
+    # Components are independent, so probe them concurrently; the slowest
+    # check bounds the response time instead of the sum of all of them.
+    checks = {
+        "database": check_database(db),
+        "queue": queue_service.health_check(),
+        "storage": storage_service.health_check(),
+        "ffmpeg": check_ffmpeg(),
+    }
+    results = await asyncio.gather(*checks.values(), return_exceptions=True)
     
-    # Check FFmpeg
-    try:
-        import asyncio
-        proc = await asyncio.create_subprocess_exec(
-            'ffmpeg', '-version',
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=5.0)
-        
-        if proc.returncode == 0:
-            version_line = stdout.decode().split("\n")[0]
-            health_status["components"]["ffmpeg"] = {
-                "status": "healthy",
-                "version": version_line,
+    for name, result in zip(checks, results):
+        if isinstance(result, BaseException):
+            # A missing FFmpeg degrades the service; anything else breaks it.
+            # Never downgrade an "unhealthy" set by an earlier component.
+            if name != "ffmpeg":
+                health_status["status"] = "unhealthy"
+            elif health_status["status"] == "healthy":
+                health_status["status"] = "degraded"
+            health_status["components"][name] = {
+                "status": "unhealthy",
+                "error": str(result),
             }
         else:
-            raise Exception("FFmpeg not working")
-    except Exception as e:
-        health_status["status"] = "degraded"
-        health_status["components"]["ffmpeg"] = {
-            "status": "unhealthy",
-            "error": str(e),
-        }
+            health_status["components"][name] = result
     
     return health_status
 
 
+async def check_database(db: AsyncSession) -> Dict[str, Any]:
+    """Check database connectivity."""
+    await db.execute(text("SELECT 1"))
+    return {
+        "status": "healthy",
+        "type": "postgresql",
+    }
+
+
+async def check_ffmpeg() -> Dict[str, Any]:
+    """Check that FFmpeg is installed and runs."""
+    if not has_tool('ffmpeg'):
+        raise Exception("FFmpeg not found on PATH")
+    
+    proc = await asyncio.create_subprocess_exec(
+        'ffmpeg', '-version',
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=5.0)
+    
+    if proc.returncode != 0:
+        raise Exception("FFmpeg not working")
+    
+    # Only the first line carries the version; don't decode the rest
+    version_line = stdout.split(b"\n", 1)[0].decode()
+    return {
+        "status": "healthy",
+        "version": version_line,
+    }
+
+
 @router.get("/capabilities")
 async def get_capabilities() -> Dict[str, Any]:
     """
@@ -161,28 +163,89 @@ async def get_capabilities() -> Dict[str, Any]:
     }
 
 
-async def check_hardware_acceleration() -> list:
+async def check_hardware_acceleration() -> List[str]:
     """Check available hardware acceleration."""
+    global _hardware_acceleration_cache
+    if _hardware_acceleration_cache is not None:
+        return list(_hardware_acceleration_cache)
+    
     available = []
+    probe_failed = False
     
-    # Check NVIDIA
+    # Check NVIDIA; prefer an in-process NVML query, then nvidia-smi, and
+    # skip the fork entirely on hosts without the driver tools. NVML calls
+    # block in C, so keep them off the event loop.
     try:
-        import asyncio
-        proc = await asyncio.create_subprocess_exec(
-            'nvidia-smi', '--query-gpu=name', '--format=csv,noheader',
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=5.0)
-        
-        if proc.returncode == 0:
-            available.append("nvidia")
-    except:
-        pass
+        nvidia = await asyncio.to_thread(check_nvml)
+    except Exception as e:
+        logger.warning("NVML probe failed", error=str(e))
+        nvidia = None
+        probe_failed = True
+    
+    if nvidia is None and has_tool('nvidia-smi'):
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                'nvidia-smi', '--query-gpu=name', '--format=csv,noheader',
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=5.0)
+            nvidia = proc.returncode == 0
+        except Exception as e:
+            logger.warning("nvidia-smi probe failed", error=str(e))
+            probe_failed = True
+    
+    if nvidia:
+        available.append("nvidia")
     
     # Check VAAPI (Linux)
     import os
     if os.path.exists("/dev/dri/renderD128"):
         available.append("vaapi")
     
-    return available
\ No newline at end of file
+    # Only cache a complete answer; a failed probe is retried next request
+    if not probe_failed:
+        _hardware_acceleration_cache = list(available)
+    return available
+
+
+def check_nvml() -> Optional[bool]:
+    """
+    Check for NVIDIA GPUs through NVML.
+    
+    Returns None when NVML can't be used on this host (no pynvml package,
+    no driver library, driver not loaded or no permission), so the caller
+    can fall back to nvidia-smi. Any other NVML error is raised.
+    """
+    try:
+        import pynvml
+    except ImportError:
+        return None
+    
+    unavailable = tuple(
+        getattr(pynvml, name)
+        for name in (
+            'NVMLError_LibraryNotFound',
+            'NVMLError_DriverNotLoaded',
+            'NVMLError_NoPermission',
+        )
+        if hasattr(pynvml, name)
+    )
+    try:
+        pynvml.nvmlInit()
+    except unavailable:
+        return None
+    
+    try:
+        return pynvml.nvmlDeviceGetCount() > 0
+    finally:
+        try:
+            pynvml.nvmlShutdown()
+        except Exception:
+            pass
+
+
+@lru_cache(maxsize=8)
+def has_tool(name: str) -> bool:
+    """Return whether an executable is on PATH (cached per process)."""
+    return shutil.which(name) is not None
\ No newline at end of file
@@ -1,7 +1,9 @@
 """
 Storage service for managing multiple backends
 """
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Set, Tuple
+import copy
+import json
 import yaml
 from pathlib import Path
 
@@ -11,8 +13,83 @@ from api.config import settings
 from storage.factory import create_storage_backend
 from storage.base import StorageBackend
 
+try:
+    # libyaml's C loader parses several times faster than the pure-Python one
+    from yaml import CSafeLoader as YAMLSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLSafeLoader
+
 logger = structlog.get_logger()
 
+if YAMLSafeLoader is yaml.SafeLoader:
+    logger.warning("libyaml not available, using pure-Python YAML loader; install libyaml-dev for faster config loading")
+
+
+# Read size for cross-backend copies; large enough that a multi-GB media
+# file is not moved through the event loop 8 KiB at a time
+COPY_CHUNK_SIZE = 1 << 20
+
+# Parsed storage configs keyed by path, stored with the file's mtime
+_storage_config_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+# Missing .json paths already warned about; workers load the config per job
+_warned_config_fallbacks: Set[str] = set()
+
+
+def resolve_storage_config_path(config_path) -> Optional[Path]:
+    """
+    Return the storage config file to read for ``config_path``.
+    
+    The configured path is used as named. If it is a ``.json`` path that
+    does not exist, the ``.yml`` file next to it is used instead. Returns
+    None when neither exists.
+    """
+    path = Path(config_path)
+    if path.exists():
+        return path
+    if path.suffix == '.json':
+        yml_path = path.with_suffix('.yml')
+        if yml_path.exists():
+            if str(path) not in _warned_config_fallbacks:
+                _warned_config_fallbacks.add(str(path))
+                logger.warning(
+                    f"Storage config {path} not found, falling back to {yml_path}"
+                )
+            return yml_path
+    return None
+
+
+def load_storage_config(config_path) -> Dict[str, Any]:
+    """
+    Load a storage configuration file.
+    
+    Paths ending in ``.json`` are parsed with the json module; anything else
+    is YAML. Parsed configs are cached until the file's mtime changes, and
+    callers always get their own copy.
+    """
+    path = resolve_storage_config_path(config_path)
+    if path is None:
+        raise FileNotFoundError(f"Storage config not found: {config_path}")
+    
+    return _read_storage_config(path)
+
+
+def _read_storage_config(path: Path) -> Dict[str, Any]:
+    """Parse an already-resolved storage config, using the mtime cache."""
+    mtime = path.stat().st_mtime_ns
+    cached = _storage_config_cache.get(str(path))
+    if cached is not None and cached[0] == mtime:
+        return copy.deepcopy(cached[1])
+    
+    with open(path, 'r') as f:
+        if path.suffix == '.json':
+            config = json.load(f)
+        else:
+            config = yaml.load(f, Loader=YAMLSafeLoader)
+    
+    _storage_config_cache[str(path)] = (mtime, config)
+    return copy.deepcopy(config)
+
 
 class StorageService:
     """Service for managing storage backends."""
@@ -24,8 +101,8 @@ class StorageService:
     async def initialize(self) -> None:
         """Initialize storage backends from configuration."""
         # Load storage configuration
-        config_path = Path(settings.STORAGE_CONFIG)
-        if not config_path.exists():
+        config_path = resolve_storage_config_path(settings.STORAGE_CONFIG)
+        if config_path is None:
             # Use default configuration
             self.config = {
                 "storage": {
@@ -40,8 +117,7 @@ class StorageService:
                 }
             }
         else:
-            with open(config_path, 'r') as f:
-                self.config = yaml.safe_load(f)
+            self.config = _read_storage_config(config_path)
         
         # Initialize backends
         storage_config = self.config.get("storage", {})
@@ -162,14 +238,19 @@ class StorageService:
         if not await src_backend.exists(src_path):
             raise FileNotFoundError(f"Source file not found: {source_uri}")
         
-        # Copy data
+        # Stream the whole source into a single destination write so the
+        # backend can upload it as one object (multipart where supported)
         bytes_copied = 0
-        async for chunk in src_backend.read(src_path):
-            await dst_backend.write(dst_path, chunk)
-            bytes_copied += len(chunk)
-            
-            if progress_callback:
-                progress_callback(bytes_copied)
+        
+        async def counted_chunks():
+            nonlocal bytes_copied
+            async for chunk in src_backend.read(src_path, chunk_size=COPY_CHUNK_SIZE):
+                bytes_copied += len(chunk)
+                if progress_callback:
+                    progress_callback(bytes_copied)
+                yield chunk
+        
+        await dst_backend.write(dst_path, counted_chunks())
         
         logger.info(f"Copied {bytes_copied} bytes from {source_uri} to {dest_uri}")
         return bytes_copied
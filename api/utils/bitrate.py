@@ -0,0 +1,14 @@
+"""
+Bitrate string parsing shared by the API validators and the worker
+"""
+import re
+
+
+BITRATE_REGEX = re.compile(r'(\d+)([kKmM]?)')
+
+# Bitrate suffix -> (multiplier, largest base value that still fits an int32)
+BITRATE_UNITS = {
+    '': (1, 2147483647),
+    'k': (1000, 2147483),
+    'm': (1000000, 2147),
+}
@@ -110,15 +110,18 @@ class MediaValidator:
                 'errors': []
             }
             
-            # Basic file existence and accessibility
-            if not os.path.exists(file_path):
+            # Basic file existence and accessibility; a single stat() answers
+            # both "does it exist" and "how big is it"
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
                 raise MediaValidationError(f"File not found: {file_path}")
             
             if not os.access(file_path, os.R_OK):
                 raise MediaValidationError(f"File not readable: {file_path}")
             
             # File size validation
-            file_size = os.path.getsize(file_path)
+            file_size = file_stat.st_size
             validation_results['file_size'] = file_size
             
             max_size = self.max_file_sizes.get(api_key_tier, self.max_file_sizes['free'])
@@ -3,11 +3,13 @@ Input validation utilities with security enhancements
 """
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
 from urllib.parse import urlparse
 
 from api.services.storage import StorageService
+from api.utils.bitrate import BITRATE_REGEX, BITRATE_UNITS
 
 
 # Allowed file extensions
@@ -39,6 +41,12 @@ class SecurityError(Exception):
     pass
 
 
+@lru_cache(maxsize=32)
+def _canonical_base_path(base_path: str) -> str:
+    """Canonicalize an allowed base directory once rather than on every validation."""
+    return os.path.realpath(os.path.abspath(base_path))
+
+
 def validate_secure_path(path: str, base_paths: set = None) -> str:
     """
     Validate and sanitize file paths to prevent directory traversal.
@@ -80,7 +88,7 @@ def validate_secure_path(path: str, base_paths: set = None) -> str:
         # Check if canonical path is within allowed base paths
         is_allowed = False
         for base_path in base_paths:
-            base_canonical = os.path.realpath(os.path.abspath(base_path))
+            base_canonical = _canonical_base_path(base_path)
             # Ensure proper path comparison with trailing separator
             if canonical_path.startswith(base_canonical + os.sep) or canonical_path == base_canonical:
                 is_allowed = True
@@ -489,29 +497,17 @@ def validate_bitrate(bitrate) -> str:
     """Validate bitrate parameter with security checks."""
     if isinstance(bitrate, str):
         # Validate bitrate format
-        if not re.match(r'^\d+[kKmM]?$', bitrate):
+        match = BITRATE_REGEX.fullmatch(bitrate)
+        if not match:
             raise ValueError(f"Invalid bitrate format: {bitrate}")
         
         # Parse and validate range with overflow protection
-        try:
-            if bitrate.lower().endswith('k'):
-                base_value = int(bitrate[:-1])
-                if base_value > 2147483:  # Prevent overflow
-                    raise ValueError("Bitrate value too large")
-                value = base_value * 1000
-            elif bitrate.lower().endswith('m'):
-                base_value = int(bitrate[:-1])
-                if base_value > 2147:  # Prevent overflow
-                    raise ValueError("Bitrate value too large")
-                value = base_value * 1000000
-            else:
-                value = int(bitrate)
-                if value > 2147483647:  # Max int32
-                    raise ValueError("Bitrate value too large")
-        except ValueError as e:
-            if "too large" in str(e):
-                raise ValueError("Bitrate value causes overflow")
-            raise ValueError(f"Invalid bitrate format: {bitrate}")
+        digits, unit = match.groups()
+        multiplier, max_base = BITRATE_UNITS[unit.lower()]
+        base_value = int(digits)
+        if base_value > max_base:
+            raise ValueError("Bitrate value causes overflow")
+        value = base_value * multiplier
         
         # Check reasonable limits (100 kbps to 50 Mbps)
         if value < 100000 or value > 50000000:
@@ -7,10 +7,41 @@ import string
 import argparse
 
 
+ALPHABET = string.ascii_letters + string.digits
+
+# Random bytes are mapped onto ALPHABET with a modulo, so bytes at or above
+# the largest multiple of len(ALPHABET) are discarded to keep every
+# character equally likely.
+_ACCEPT_LIMIT = 256 - (256 % len(ALPHABET))
+_BYTE_TO_CHAR = bytes(
+    ord(ALPHABET[b % len(ALPHABET)]) if b < _ACCEPT_LIMIT else 0
+    for b in range(256)
+)
+_REJECTED_BYTES = bytes(range(_ACCEPT_LIMIT, 256))
+
+
+def generate_api_keys(count: int, length: int = 32) -> list:
+    """Generate several secure random API keys from one batch of OS randomness."""
+    if count < 1:
+        raise ValueError(f"count must be at least 1, got {count}")
+    if length < 1:
+        raise ValueError(f"length must be at least 1, got {length}")
+    
+    needed = count * length
+    chars = b''
+    while len(chars) < needed:
+        # Over-request slightly so a single read almost always covers rejections
+        shortfall = needed - len(chars)
+        raw = secrets.token_bytes(shortfall + shortfall // 16 + 16)
+        chars += raw.translate(_BYTE_TO_CHAR, _REJECTED_BYTES)
+    
+    text = chars[:needed].decode('ascii')
+    return [text[i:i + length] for i in range(0, needed, length)]
+
+
 def generate_api_key(length: int = 32) -> str:
     """Generate a secure random API key."""
-    alphabet = string.ascii_letters + string.digits
-    return ''.join(secrets.choice(alphabet) for _ in range(length))
+    return generate_api_keys(1, length)[0]
 
 
 def main():
@@ -34,8 +65,12 @@ def main():
     )
     
     args = parser.parse_args()
+    if args.number < 1:
+        parser.error('--number must be at least 1')
+    if args.length < 1:
+        parser.error('--length must be at least 1')
     
-    keys = [generate_api_key(args.length) for _ in range(args.number)]
+    keys = generate_api_keys(args.number, args.length)
     
     if args.admin:
         print("# Add this to your .env file:")
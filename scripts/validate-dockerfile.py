@@ -5,80 +5,153 @@ This script checks for the specific issue in GitHub Issue #10.
 """
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Compiled once at import; matched against every logical line of every Dockerfile
+_ARG_RE = re.compile(r'(\w+)')
+_FROM_VAR_RE = re.compile(r'\$\{(\w+)\}')
+_ISSUE_RE = re.compile(r'runtime-\$\{(\w+)\}')
 
-def validate_dockerfile(dockerfile_path):
-    """Validate Dockerfile for ARG/FROM issues."""
-    print(f"🔍 Validating: {dockerfile_path}")
-    
-    if not dockerfile_path.exists():
-        print(f"❌ File not found: {dockerfile_path}")
-        return False
-    
-    with open(dockerfile_path, 'r') as f:
-        lines = f.readlines()
+
+def _logical_lines(lines):
+    """
+    Yield (line_number, line) for each logical Dockerfile instruction.
     
-    # Track ARG declarations and their positions
-    args_declared = {}
-    from_statements = []
+    Lines ending in a backslash are joined with the lines that follow, as
+    Docker does, so an instruction split across lines is seen whole. The
+    line number is that of the instruction's first physical line.
     
-    for i, line in enumerate(lines, 1):
-        line = line.strip()
+    ``lines`` may be an open file; it is consumed lazily, one line at a time.
+    """
+    parts = []
+    start = None
+    for i, raw in enumerate(lines, 1):
+        line = raw.strip()
         
-        # Skip comments and empty lines
+        # Skip comments and empty lines, including inside continuations
         if not line or line.startswith('#'):
             continue
         
-        # Find ARG declarations
-        if line.startswith('ARG '):
-            arg_match = re.match(r'ARG\s+(\w+)(?:=.*)?', line)
-            if arg_match:
-                arg_name = arg_match.group(1)
-                args_declared[arg_name] = i
-                print(f"✅ Found ARG declaration: {arg_name} at line {i}")
+        if start is None:
+            start = i
+        
+        if line.endswith('\\'):
+            parts.append(line[:-1].strip())
+            continue
+        
+        parts.append(line)
+        text = ' '.join(part for part in parts if part)
+        if text:
+            yield start, text
+        parts = []
+        start = None
+    
+    # A trailing continuation may hold nothing but a lone backslash
+    text = ' '.join(part for part in parts if part)
+    if text:
+        yield start, text
+
+
+def _handle_arg(i, line, rest, args_declared, runtime_stages, log):
+    """Record an ARG declaration."""
+    arg_match = _ARG_RE.match(rest)
+    if arg_match:
+        arg_name = arg_match.group(1)
+        args_declared[arg_name] = i
+        log(f"✅ Found ARG declaration: {arg_name} at line {i}")
+    return True
+
+
+def _handle_from(i, line, rest, args_declared, runtime_stages, log):
+    """Check that every variable used in a FROM was declared before it."""
+    # Only runtime-${VAR} stage selections are needed after the pass
+    issue_match = _ISSUE_RE.search(rest)
+    if issue_match:
+        runtime_stages.append((i, line, issue_match.group(1)))
+    
+    for var_match in _FROM_VAR_RE.finditer(rest):
+        var_name = var_match.group(1)
+        log(f"📋 FROM statement at line {i} uses variable: {var_name}")
         
-        # Find FROM statements with variables
-        if line.startswith('FROM '):
-            from_statements.append((i, line))
+        # Check if ARG was declared before this FROM
+        if var_name not in args_declared:
+            log(f"❌ ERROR: Variable {var_name} used in FROM at line {i} but never declared")
+            return False
+        elif args_declared[var_name] > i:
+            log(f"❌ ERROR: Variable {var_name} declared at line {args_declared[var_name]} but used in FROM at line {i}")
+            log(f"   FIX: Move 'ARG {var_name}' to before line {i}")
+            return False
+        else:
+            log(f"✅ Variable {var_name} properly declared before use")
+    return True
+
+
+# Instruction keyword -> handler; other instructions are not inspected
+_DISPATCH = {
+    'ARG': _handle_arg,
+    'FROM': _handle_from,
+}
+
+
+def validate_dockerfile(dockerfile_path, log=print):
+    """
+    Validate Dockerfile for ARG/FROM issues.
+    
+    Progress messages go to ``log`` so callers validating several files at
+    once can collect each file's output separately.
+    """
+    log(f"🔍 Validating: {dockerfile_path}")
+    
+    if not dockerfile_path.exists():
+        log(f"❌ File not found: {dockerfile_path}")
+        return False
+    
+    # Track ARG declarations and their positions
+    args_declared = {}
+    runtime_stages = []
+    
+    with open(dockerfile_path, 'r') as f:
+        for i, line in _logical_lines(f):
+            tokens = line.split(None, 1)
+            handler = _DISPATCH.get(tokens[0].upper())
+            if handler is None:
+                continue
             
-            # Check for variable usage in FROM
-            var_match = re.search(r'\$\{(\w+)\}', line)
-            if var_match:
-                var_name = var_match.group(1)
-                print(f"📋 FROM statement at line {i} uses variable: {var_name}")
-                
-                # Check if ARG was declared before this FROM
-                if var_name not in args_declared:
-                    print(f"❌ ERROR: Variable {var_name} used in FROM at line {i} but never declared")
-                    return False
-                elif args_declared[var_name] > i:
-                    print(f"❌ ERROR: Variable {var_name} declared at line {args_declared[var_name]} but used in FROM at line {i}")
-                    print(f"   FIX: Move 'ARG {var_name}' to before line {i}")
-                    return False
-                else:
-                    print(f"✅ Variable {var_name} properly declared before use")
+            rest = tokens[1] if len(tokens) > 1 else ''
+            if not handler(i, line, rest, args_declared, runtime_stages, log):
+                return False
     
     # Check for the specific issue from GitHub Issue #10
     issue_found = False
-    for i, from_line in from_statements:
-        if 'runtime-${' in from_line:
-            print(f"🎯 Found runtime stage selection at line {i}: {from_line}")
-            if 'WORKER_TYPE' in from_line:
-                if 'WORKER_TYPE' in args_declared:
-                    print(f"✅ WORKER_TYPE properly declared at line {args_declared['WORKER_TYPE']}")
-                else:
-                    print(f"❌ WORKER_TYPE used but not declared!")
-                    issue_found = True
+    for i, from_line, stage_var in runtime_stages:
+        log(f"🎯 Found runtime stage selection at line {i}: {from_line}")
+        if stage_var == 'WORKER_TYPE':
+            if 'WORKER_TYPE' in args_declared:
+                log(f"✅ WORKER_TYPE properly declared at line {args_declared['WORKER_TYPE']}")
+            else:
+                log(f"❌ WORKER_TYPE used but not declared!")
+                issue_found = True
     
     if issue_found:
-        print(f"❌ GitHub Issue #10 detected in {dockerfile_path}")
+        log(f"❌ GitHub Issue #10 detected in {dockerfile_path}")
         return False
     
-    print(f"✅ Dockerfile validation passed: {dockerfile_path}")
+    log(f"✅ Dockerfile validation passed: {dockerfile_path}")
     return True
 
 
+def _validate_buffered(dockerfile):
+    """Validate one Dockerfile, returning (valid, output_lines)."""
+    output = []
+    try:
+        valid = validate_dockerfile(dockerfile, log=output.append)
+    except Exception as e:
+        output.append(f"❌ Error validating {dockerfile}: {e}")
+        valid = False
+    return valid, output
+
+
 def main():
     """Main validation function."""
     print("🐳 Docker Dockerfile Validator for GitHub Issue #10")
@@ -98,12 +171,15 @@ def main():
     
     all_valid = True
     
-    for dockerfile in dockerfiles:
-        try:
-            if not validate_dockerfile(dockerfile):
-                all_valid = False
-        except Exception as e:
-            print(f"❌ Error validating {dockerfile}: {e}")
+    # Files are independent; validate them concurrently and print each
+    # file's buffered output afterwards so reports don't interleave
+    with ThreadPoolExecutor(max_workers=len(dockerfiles)) as executor:
+        results = list(executor.map(_validate_buffered, dockerfiles))
+    
+    for valid, output in results:
+        for line in output:
+            print(line)
+        if not valid:
             all_valid = False
         print()
     
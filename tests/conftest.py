@@ -2,16 +2,24 @@
 Test configuration and fixtures
 """
 import pytest
+import pytest_asyncio
 import asyncio
+import itertools
+from types import MappingProxyType, SimpleNamespace
 from typing import Generator
 from unittest.mock import AsyncMock, MagicMock
-from uuid import uuid4
+from uuid import UUID
 
-from fastapi.testclient import TestClient
+from sqlalchemy import event, insert
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+try:
+    # Installed with uvicorn[standard] on Linux and macOS
+    import uvloop
+except ImportError:
+    uvloop = None
 
-from api.main import app
 from api.models.database import Base
 from api.models.api_key import APIKey
 from api.models.job import Job, JobStatus, JobType
@@ -21,20 +29,95 @@ from api.models.job import Job, JobStatus, JobType
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
+# Read-only sample payloads shared by the whole session
+_SAMPLE_JOB_DATA = MappingProxyType({
+    "type": "convert",
+    "input_file": "input.mp4",
+    "output_file": "output.mp4",
+    "parameters": MappingProxyType({
+        "codec": "h264",
+        "bitrate": "1000k",
+        "resolution": "1920x1080"
+    }),
+    "priority": 1
+})
+_SAMPLE_API_KEY_DATA = MappingProxyType({
+    "name": "Test API Key",
+    "rate_limit": 1000,
+    "description": "API key for testing"
+})
+
+
+# Sequential ids for unpersisted mock objects; unique within the run without
+# drawing from os.urandom like uuid4() does
+_mock_id_counter = itertools.count(1)
+
+
+def _mock_uuid() -> UUID:
+    return UUID(int=next(_mock_id_counter))
+
+
+def _noop(*args, **kwargs):
+    return None
+
+
+# Passive stand-ins with fixed answers; tests that need to assert on calls
+# should patch with a MagicMock locally instead
+_FAKE_REDIS = SimpleNamespace(
+    get=_noop,
+    set=lambda *args, **kwargs: True,
+    delete=lambda *args, **kwargs: True,
+    exists=lambda *args, **kwargs: False,
+)
+_FAKE_STORAGE = SimpleNamespace(
+    upload_file=lambda *args, **kwargs: "https://storage.example.com/file.mp4",
+    download_file=lambda *args, **kwargs: b"fake video content",
+    delete_file=lambda *args, **kwargs: True,
+    file_exists=lambda *args, **kwargs: True,
+)
+_FAKE_WEBHOOK = SimpleNamespace(send_notification=lambda *args, **kwargs: True)
+_FAKE_METRICS = SimpleNamespace(increment=_noop, gauge=_noop, histogram=_noop)
+_FAKE_LOGGER = SimpleNamespace(info=_noop, warning=_noop, error=_noop, debug=_noop)
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on the session event loop that owns async_engine."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy():
+    """Create the test session's event loops with uvloop when available."""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def async_engine():
-    """Create async database engine for testing."""
-    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    """Create one in-memory database engine shared by the whole test session."""
+    # StaticPool keeps the single :memory: connection alive; without it the
+    # database vanishes whenever the pool closes its connection
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        echo=False,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work under aiosqlite
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
     
-    # Create tables
+    # Create tables once for the session
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     
@@ -44,20 +127,32 @@ async def async_engine():
     await engine.dispose()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def async_session(async_engine):
-    """Create async database session for testing."""
-    async_session_maker = sessionmaker(
-        async_engine, class_=AsyncSession, expire_on_commit=False
-    )
-    
-    async with async_session_maker() as session:
-        yield session
+    """Create a database session whose changes are rolled back after the test."""
+    async with async_engine.connect() as conn:
+        trans = await conn.begin()
+        
+        # Commits made by the test only release a SAVEPOINT; the outer
+        # transaction is rolled back so rows never leak between tests
+        async with AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        ) as session:
+            yield session
+        
+        await trans.rollback()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
     """Create test client."""
+    # Imported here so collecting model/service-only tests does not build
+    # the whole application
+    from fastapi.testclient import TestClient
+    from api.main import app
+    
     return TestClient(app)
 
 
@@ -65,7 +160,7 @@ def client():
 def mock_api_key():
     """Create a mock API key for testing."""
     return APIKey(
-        id=uuid4(),
+        id=_mock_uuid(),
         name="Test API Key",
         key_hash="hashed_test_key",
         key_prefix="sk-test",
@@ -79,7 +174,7 @@ def mock_api_key():
 def mock_job():
     """Create a mock job for testing."""
     return Job(
-        id=uuid4(),
+        id=_mock_uuid(),
         type=JobType.CONVERT,
         status=JobStatus.PENDING,
         priority=1,
@@ -87,11 +182,11 @@ def mock_job():
         output_file="test_output.mp4",
         parameters={"codec": "h264", "bitrate": "1000k"},
         progress=0.0,
-        api_key_id=uuid4()
+        api_key_id=_mock_uuid()
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def auth_headers():
     """Create authentication headers for testing."""
     return {"X-API-Key": "sk-test_valid_key_for_testing"}
@@ -103,15 +198,10 @@ def mock_async_session():
     return AsyncMock(spec=AsyncSession)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_redis():
     """Create a mock Redis client."""
-    mock_redis = MagicMock()
-    mock_redis.get.return_value = None
-    mock_redis.set.return_value = True
-    mock_redis.delete.return_value = True
-    mock_redis.exists.return_value = False
-    return mock_redis
+    return _FAKE_REDIS
 
 
 @pytest.fixture
@@ -122,30 +212,24 @@ def mock_celery_app():
     return mock_celery
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_job_data():
     """Sample job data for testing."""
-    return {
-        "type": "convert",
-        "input_file": "input.mp4",
-        "output_file": "output.mp4",
-        "parameters": {
-            "codec": "h264",
-            "bitrate": "1000k",
-            "resolution": "1920x1080"
-        },
-        "priority": 1
-    }
+    return _SAMPLE_JOB_DATA
 
 
 @pytest.fixture
+def sample_job_data_mutable():
+    """Mutable copy of the sample job data for tests that modify it."""
+    data = dict(_SAMPLE_JOB_DATA)
+    data["parameters"] = dict(_SAMPLE_JOB_DATA["parameters"])
+    return data
+
+
+@pytest.fixture(scope="session")
 def sample_api_key_data():
     """Sample API key data for testing."""
-    return {
-        "name": "Test API Key",
-        "rate_limit": 1000,
-        "description": "API key for testing"
-    }
+    return _SAMPLE_API_KEY_DATA
 
 
 @pytest.fixture
@@ -159,15 +243,10 @@ def mock_file_upload():
     return mock_file
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_storage():
     """Create a mock storage client."""
-    mock_storage = MagicMock()
-    mock_storage.upload_file.return_value = "https://storage.example.com/file.mp4"
-    mock_storage.download_file.return_value = b"fake video content"
-    mock_storage.delete_file.return_value = True
-    mock_storage.file_exists.return_value = True
-    return mock_storage
+    return _FAKE_STORAGE
 
 
 @pytest.fixture
@@ -192,70 +271,60 @@ def mock_ffmpeg():
     return mock_ffmpeg
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_webhook():
     """Create a mock webhook client."""
-    mock_webhook = MagicMock()
-    mock_webhook.send_notification.return_value = True
-    return mock_webhook
+    return _FAKE_WEBHOOK
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_metrics():
     """Create a mock metrics client."""
-    mock_metrics = MagicMock()
-    mock_metrics.increment.return_value = None
-    mock_metrics.gauge.return_value = None
-    mock_metrics.histogram.return_value = None
-    return mock_metrics
+    return _FAKE_METRICS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_logger():
     """Create a mock logger."""
-    mock_logger = MagicMock()
-    mock_logger.info.return_value = None
-    mock_logger.warning.return_value = None
-    mock_logger.error.return_value = None
-    mock_logger.debug.return_value = None
-    return mock_logger
+    return _FAKE_LOGGER
 
 
 # Database fixtures for integration tests
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def test_api_key(async_session):
     """Create a test API key in the database."""
-    api_key = APIKey(
-        name="Test API Key",
-        key_hash="hashed_test_key",
-        key_prefix="sk-test",
-        is_active=True,
-        rate_limit=1000
+    # INSERT ... RETURNING loads generated columns without a refresh()
+    result = await async_session.scalars(
+        insert(APIKey).values(
+            name="Test API Key",
+            key_hash="hashed_test_key",
+            key_prefix="sk-test",
+            is_active=True,
+            rate_limit=1000
+        ).returning(APIKey)
     )
-    
-    async_session.add(api_key)
+    api_key = result.one()
     await async_session.commit()
-    await async_session.refresh(api_key)
     
     return api_key
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def test_job(async_session, test_api_key):
     """Create a test job in the database."""
-    job = Job(
-        type=JobType.CONVERT,
-        status=JobStatus.PENDING,
-        priority=1,
-        input_file="test_input.mp4",
-        output_file="test_output.mp4",
-        parameters={"codec": "h264"},
-        api_key_id=test_api_key.id
+    result = await async_session.scalars(
+        insert(Job).values(
+            type=JobType.CONVERT,
+            status=JobStatus.PENDING,
+            priority=1,
+            input_file="test_input.mp4",
+            output_file="test_output.mp4",
+            parameters={"codec": "h264"},
+            api_key_id=test_api_key.id
+        ).returning(Job)
     )
-    
-    async_session.add(job)
+    job = result.one()
     await async_session.commit()
-    await async_session.refresh(job)
     
     return job
 
@@ -269,14 +338,14 @@ class TestUtils:
                        status: JobStatus = JobStatus.PENDING) -> Job:
         """Create a mock job with specified parameters."""
         return Job(
-            id=uuid4(),
+            id=_mock_uuid(),
             type=job_type,
             status=status,
             priority=1,
             input_file="test.mp4",
             output_file="output.mp4",
             parameters={"codec": "h264"},
-            api_key_id=uuid4()
+            api_key_id=_mock_uuid()
         )
     
     @staticmethod
@@ -284,7 +353,7 @@ class TestUtils:
                            is_active: bool = True) -> APIKey:
         """Create a mock API key with specified parameters."""
         return APIKey(
-            id=uuid4(),
+            id=_mock_uuid(),
             name=name,
             key_hash="hashed_value",
             key_prefix="sk-test",
@@ -294,7 +363,7 @@ class TestUtils:
         )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_utils():
     """Provide test utilities."""
     return TestUtils
\ No newline at end of file
@@ -2,35 +2,13 @@
 Test API key authentication and management
 """
 import pytest
-from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession
 from unittest.mock import AsyncMock, patch
 
-from api.main import app
 from api.models.api_key import APIKey
 from api.services.api_key import APIKeyService
 
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
-
-
-@pytest.fixture
-def mock_api_key():
-    """Mock API key for testing."""
-    return APIKey(
-        id="test-key-id",
-        name="Test Key",
-        key_hash="hashed_key_value",
-        key_prefix="sk-test",
-        is_active=True,
-        usage_count=5,
-        rate_limit=1000
-    )
-
-
 class TestAPIKeyAuthentication:
     """Test API key authentication."""
 
@@ -1,16 +1,14 @@
 """
 Test health endpoints
 """
-import pytest
-from fastapi.testclient import TestClient
-
-from api.main import app
+import sys
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
+from api.routers import health
 
 
 def test_health_check(client):
@@ -58,4 +56,165 @@ def test_capabilities(client):
     assert "input" in formats
     assert "output" in formats
     assert "mp4" in formats["input"]["video"]
-    assert "h264" in formats["output"]["video_codecs"]
\ No newline at end of file
+    assert "h264" in formats["output"]["video_codecs"]
+
+async def _detailed_health(**failures):
+    """Run the detailed health check; checks named in failures raise."""
+    component_checks = {
+        "database": (health, "check_database"),
+        "queue": (health.queue_service, "health_check"),
+        "storage": (health.storage_service, "health_check"),
+        "ffmpeg": (health, "check_ffmpeg"),
+    }
+    with ExitStack() as stack:
+        for name, (target, attribute) in component_checks.items():
+            if name in failures:
+                check = AsyncMock(side_effect=failures[name])
+            else:
+                check = AsyncMock(return_value={"status": "healthy"})
+            stack.enter_context(patch.object(target, attribute, check))
+        
+        return await health.detailed_health_check(db=MagicMock())
+
+
+class TestDetailedHealthStatus:
+    """Test how component results combine into the overall status."""
+    
+    @pytest.mark.asyncio
+    async def test_all_components_healthy(self):
+        """Test passing checks leave the service healthy."""
+        result = await _detailed_health()
+        
+        assert result["status"] == "healthy"
+        assert set(result["components"]) == {"database", "queue", "storage", "ffmpeg"}
+    
+    @pytest.mark.asyncio
+    async def test_ffmpeg_failure_degrades(self):
+        """Test an FFmpeg-only failure reports degraded."""
+        result = await _detailed_health(ffmpeg=Exception("FFmpeg not found on PATH"))
+        
+        assert result["status"] == "degraded"
+    
+    @pytest.mark.asyncio
+    async def test_core_failure_is_unhealthy_regardless_of_ffmpeg(self):
+        """Test a database, queue or storage failure is never downgraded."""
+        for name in ("database", "queue", "storage"):
+            for ffmpeg_error in (None, Exception("FFmpeg not working")):
+                failures = {name: ConnectionError(f"{name} down")}
+                if ffmpeg_error is not None:
+                    failures["ffmpeg"] = ffmpeg_error
+                
+                result = await _detailed_health(**failures)
+                
+                assert result["status"] == "unhealthy", (name, ffmpeg_error)
+    
+    @pytest.mark.asyncio
+    async def test_exceptions_are_reported_not_raised(self):
+        """Test a raising check is recorded in its component entry."""
+        result = await _detailed_health(queue=RuntimeError("redis unreachable"))
+        
+        assert result["components"]["queue"] == {
+            "status": "unhealthy",
+            "error": "redis unreachable",
+        }
+        assert result["components"]["database"] == {"status": "healthy"}
+        assert result["components"]["storage"] == {"status": "healthy"}
+        assert result["components"]["ffmpeg"] == {"status": "healthy"}
+
+
+class TestHardwareAccelerationCache:
+    """Test caching of the hardware acceleration probe."""
+    
+    @pytest.fixture(autouse=True)
+    def reset_hardware_cache(self):
+        """Start each test with no cached probe and no nvidia-smi."""
+        with patch.object(health, "_hardware_acceleration_cache", None), \
+                patch.object(health, "has_tool", return_value=False):
+            yield
+    
+    @pytest.mark.asyncio
+    async def test_failed_probe_is_not_cached(self):
+        """Test a failed NVML probe is retried on the next request."""
+        with patch.object(health, "check_nvml", side_effect=RuntimeError("NVML busy")):
+            first = await health.check_hardware_acceleration()
+        
+        assert "nvidia" not in first
+        assert health._hardware_acceleration_cache is None
+        
+        with patch.object(health, "check_nvml", return_value=True):
+            second = await health.check_hardware_acceleration()
+        
+        assert "nvidia" in second
+    
+    @pytest.mark.asyncio
+    async def test_successful_probe_is_reused(self):
+        """Test a successful probe is served from the cache afterwards."""
+        with patch.object(health, "check_nvml", return_value=True) as check_nvml:
+            first = await health.check_hardware_acceleration()
+            second = await health.check_hardware_acceleration()
+        
+        assert "nvidia" in first
+        assert second == first
+        check_nvml.assert_called_once()
+
+
+
+def _fake_pynvml(init_error=None):
+    """Build a stand-in pynvml module whose nvmlInit raises init_error."""
+    class NVMLError(Exception):
+        pass
+    
+    class NVMLError_DriverNotLoaded(NVMLError):
+        pass
+    
+    class NVMLError_Unknown(NVMLError):
+        pass
+    
+    errors = {
+        "driver_not_loaded": NVMLError_DriverNotLoaded,
+        "unknown": NVMLError_Unknown,
+    }
+    
+    def nvml_init():
+        if init_error:
+            raise errors[init_error]()
+    
+    return SimpleNamespace(
+        NVMLError=NVMLError,
+        NVMLError_DriverNotLoaded=NVMLError_DriverNotLoaded,
+        nvmlInit=nvml_init,
+        nvmlDeviceGetCount=lambda: 1,
+        nvmlShutdown=lambda: None,
+    )
+
+
+class TestCheckNvml:
+    """Test the NVML GPU probe."""
+    
+    def test_driver_not_loaded_is_unavailable(self):
+        """Test a host without a loaded driver falls back instead of failing."""
+        with patch.dict(sys.modules, {"pynvml": _fake_pynvml("driver_not_loaded")}):
+            assert health.check_nvml() is None
+    
+    def test_other_nvml_errors_are_raised(self):
+        """Test unexpected NVML errors reach the caller as probe failures."""
+        fake = _fake_pynvml("unknown")
+        with patch.dict(sys.modules, {"pynvml": fake}):
+            with pytest.raises(fake.NVMLError):
+                health.check_nvml()
+    
+    def test_gpu_present(self):
+        """Test a working NVML reports a GPU."""
+        with patch.dict(sys.modules, {"pynvml": _fake_pynvml()}):
+            assert health.check_nvml() is True
+    
+    @pytest.mark.asyncio
+    async def test_driver_not_loaded_result_is_cached(self):
+        """Test the no-GPU answer on a driver-less host is cached."""
+        with patch.object(health, "_hardware_acceleration_cache", None), \
+                patch.object(health, "has_tool", return_value=False), \
+                patch.dict(sys.modules, {"pynvml": _fake_pynvml("driver_not_loaded")}):
+            available = await health.check_hardware_acceleration()
+            
+            assert "nvidia" not in available
+            assert health._hardware_acceleration_cache == available
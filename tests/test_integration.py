@@ -5,25 +5,24 @@ Tests end-to-end workflows and component interactions
 import asyncio
 import json
 import os
-import tempfile
 from pathlib import Path
 from typing import AsyncGenerator
 import pytest
+import pytest_asyncio
 import httpx
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
-from api.main import app
 from api.models.database import Base
 from api.models.job import Job, JobStatus
 from api.config import settings
 
 
-@pytest.fixture(scope="session")
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def test_engine():
     """Create test database engine."""
     test_db_url = settings.DATABASE_URL.replace("ffmpeg_api", "ffmpeg_api_test")
-    engine = create_async_engine(test_db_url, echo=True)
+    engine = create_async_engine(test_db_url, echo=False)
     
     # Create tables
     async with engine.begin() as conn:
@@ -37,7 +36,7 @@ async def test_engine():
     await engine.dispose()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def test_db(test_engine) -> AsyncGenerator[AsyncSession, None]:
     """Create test database session."""
     TestSessionLocal = sessionmaker(
@@ -48,19 +47,25 @@ async def test_db(test_engine) -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def test_client():
     """Create test HTTP client."""
-    async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+    # Imported here so collecting this module does not build the app
+    from api.main import app
+    
+    # ASGITransport dispatches requests to the app in-process on the test's
+    # event loop, with no socket or thread hand-off
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
         yield client
 
 
-@pytest.fixture
-def sample_video():
+@pytest.fixture(scope="session")
+def sample_video(tmp_path_factory):
     """Create a sample video file for testing."""
-    # Create a minimal test video using FFmpeg
-    test_dir = Path(tempfile.gettempdir()) / "ffmpeg_test"
-    test_dir.mkdir(exist_ok=True)
+    # Create a minimal test video using FFmpeg, once per session; tests
+    # only read it as job input
+    test_dir = tmp_path_factory.mktemp("ffmpeg_test")
     
     video_path = test_dir / "test_video.mp4"
     
@@ -416,12 +421,11 @@ class TestErrorHandling:
         headers = {"X-API-Key": "test-api-key", "Content-Type": "application/json"}
         
         # Send malformed JSON
-        async with httpx.AsyncClient(app=app, base_url="http://test") as client:
-            response = await client.post(
-                "/api/v1/convert",
-                content='{"input": "/path", "output":}',  # Malformed JSON
-                headers=headers
-            )
+        response = await test_client.post(
+            "/api/v1/convert",
+            content='{"input": "/path", "output":}',  # Malformed JSON
+            headers=headers
+        )
         
         assert response.status_code == 422
     
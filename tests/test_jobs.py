@@ -2,44 +2,14 @@
 Test job management endpoints and functionality
 """
 import pytest
-from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession
 from unittest.mock import AsyncMock, patch, MagicMock
 from uuid import uuid4
 
-from api.main import app
-from api.models.job import Job, JobStatus, JobType
+from api.models.job import JobStatus, JobType
 from api.services.job import JobService
 
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
-
-
-@pytest.fixture
-def mock_job():
-    """Mock job for testing."""
-    return Job(
-        id=uuid4(),
-        type=JobType.CONVERT,
-        status=JobStatus.PENDING,
-        priority=1,
-        input_file="test.mp4",
-        output_file="output.mp4",
-        parameters={"codec": "h264"},
-        progress=0.0,
-        api_key_id=uuid4()
-    )
-
-
-@pytest.fixture
-def auth_headers():
-    """Authentication headers for testing."""
-    return {"X-API-Key": "sk-test_valid_key"}
-
-
 class TestJobEndpoints:
     """Test job-related endpoints."""
 
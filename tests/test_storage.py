@@ -0,0 +1,171 @@
+"""
+Test storage service configuration loading and copying
+"""
+import json
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from api.services import storage
+from api.services.storage import (
+    StorageService,
+    load_storage_config,
+    resolve_storage_config_path,
+)
+
+
+YAML_CONFIG = """storage:
+  default_backend: local
+  backends:
+    local:
+      type: filesystem
+      base_path: /storage
+"""
+
+JSON_CONFIG = {
+    "storage": {
+        "default_backend": "s3",
+        "backends": {"s3": {"type": "s3", "bucket": "media"}},
+    }
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """Start every test with an empty parsed-config cache."""
+    storage._storage_config_cache.clear()
+    storage._warned_config_fallbacks.clear()
+    yield
+    storage._storage_config_cache.clear()
+    storage._warned_config_fallbacks.clear()
+
+
+class TestLoadStorageConfig:
+    """Test storage configuration loading and caching."""
+
+    def test_load_yaml_config(self, tmp_path):
+        """Test a .yml path is parsed as YAML."""
+        config_path = tmp_path / "storage.yml"
+        config_path.write_text(YAML_CONFIG)
+
+        config = load_storage_config(config_path)
+
+        assert config["storage"]["default_backend"] == "local"
+        assert config["storage"]["backends"]["local"]["base_path"] == "/storage"
+
+    def test_load_json_config(self, tmp_path):
+        """Test a .json path is parsed as JSON."""
+        config_path = tmp_path / "storage.json"
+        config_path.write_text(json.dumps(JSON_CONFIG))
+
+        assert load_storage_config(config_path) == JSON_CONFIG
+
+    def test_json_sibling_does_not_override_yaml(self, tmp_path):
+        """Test the configured .yml is read even when a storage.json exists."""
+        (tmp_path / "storage.yml").write_text(YAML_CONFIG)
+        (tmp_path / "storage.json").write_text(json.dumps(JSON_CONFIG))
+
+        config = load_storage_config(tmp_path / "storage.yml")
+
+        assert config["storage"]["default_backend"] == "local"
+
+    def test_missing_json_falls_back_to_yaml(self, tmp_path):
+        """Test a missing .json path falls back to the .yml next to it."""
+        (tmp_path / "storage.yml").write_text(YAML_CONFIG)
+
+        assert resolve_storage_config_path(tmp_path / "storage.json") == tmp_path / "storage.yml"
+        config = load_storage_config(tmp_path / "storage.json")
+        assert config["storage"]["default_backend"] == "local"
+
+    def test_fallback_warns_once(self, tmp_path):
+        """Test the .json -> .yml fallback is logged once, not on every load."""
+        (tmp_path / "storage.yml").write_text(YAML_CONFIG)
+
+        with patch.object(storage, "logger") as logger:
+            for _ in range(3):
+                load_storage_config(tmp_path / "storage.json")
+
+        logger.warning.assert_called_once()
+
+    def test_missing_config(self, tmp_path):
+        """Test a missing config resolves to None and fails to load."""
+        assert resolve_storage_config_path(tmp_path / "storage.yml") is None
+
+        with pytest.raises(FileNotFoundError):
+            load_storage_config(tmp_path / "storage.yml")
+
+    def test_reload_after_mtime_change(self, tmp_path):
+        """Test an edited file is re-parsed instead of served from cache."""
+        config_path = tmp_path / "storage.json"
+        config_path.write_text(json.dumps(JSON_CONFIG))
+        assert load_storage_config(config_path)["storage"]["default_backend"] == "s3"
+
+        updated = {"storage": {"default_backend": "local", "backends": {}}}
+        config_path.write_text(json.dumps(updated))
+        mtime_ns = config_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(config_path, ns=(mtime_ns, mtime_ns))
+
+        assert load_storage_config(config_path) == updated
+
+    def test_unchanged_file_is_served_from_cache(self, tmp_path):
+        """Test an unchanged file is not parsed again."""
+        config_path = tmp_path / "storage.json"
+        config_path.write_text(json.dumps(JSON_CONFIG))
+        load_storage_config(config_path)
+
+        # Poison the cached entry; a cache hit returns it unchanged
+        mtime_ns, _ = storage._storage_config_cache[str(config_path)]
+        storage._storage_config_cache[str(config_path)] = (mtime_ns, {"cached": True})
+
+        assert load_storage_config(config_path) == {"cached": True}
+
+    def test_returns_independent_copies(self, tmp_path):
+        """Test mutating a returned config does not leak into the cache."""
+        config_path = tmp_path / "storage.json"
+        config_path.write_text(json.dumps(JSON_CONFIG))
+
+        first = load_storage_config(config_path)
+        first["storage"]["backends"]["s3"]["bucket"] = "changed"
+        first["storage"]["backends"]["extra"] = {}
+
+        second = load_storage_config(config_path)
+
+        assert second == JSON_CONFIG
+        assert second is not first
+
+
+class TestStorageService:
+    """Test storage service functionality."""
+
+    @pytest.mark.asyncio
+    async def test_copy_between_backends_single_write(self):
+        """Test cross-backend copy streams the source into one write."""
+        chunks = [b"a" * 10, b"b" * 20, b"c" * 5]
+        
+        async def fake_read(path, chunk_size=8192):
+            for chunk in chunks:
+                yield chunk
+        
+        received = []
+        
+        async def fake_write(path, content):
+            received.append((path, [chunk async for chunk in content]))
+        
+        src = MagicMock()
+        src.exists = AsyncMock(return_value=True)
+        src.read = fake_read
+        dst = MagicMock()
+        dst.write = fake_write
+        
+        service = StorageService()
+        service.backends = {"local": src, "s3": dst}
+        progress = []
+        
+        copied = await service.copy_between_backends(
+            "local:///in.mp4", "s3://bucket/out.mp4", progress_callback=progress.append
+        )
+        
+        assert copied == 35
+        assert received == [("bucket/out.mp4", chunks)]
+        assert progress == [10, 30, 35]
@@ -17,6 +17,7 @@ from sqlalchemy.orm import sessionmaker
 
 from api.config import settings
 from api.models.job import Job, JobStatus
+from api.services.storage import load_storage_config
 from storage.factory import create_storage_backend
 from worker.processors.video import VideoProcessor
 from worker.processors.analysis import AnalysisProcessor
@@ -38,6 +39,10 @@ else:
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Outputs are streamed to storage in parts of this size instead of being
+# read into memory whole
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
 
 class ProcessingError(Exception):
     """Custom exception for processing errors."""
@@ -186,9 +191,7 @@ async def process_job_async(job: Job, progress: ProgressTracker) -> Dict[str, An
     import shutil
     
     # Load storage configuration
-    with open(settings.STORAGE_CONFIG, 'r') as f:
-        import yaml
-        storage_config = yaml.safe_load(f)
+    storage_config = load_storage_config(settings.STORAGE_CONFIG)
     
     # Parse input/output paths
     input_backend_name, input_path = parse_storage_path(job.input_path)
@@ -243,9 +246,7 @@ async def process_job_async(job: Job, progress: ProgressTracker) -> Dict[str, An
         
         # Upload output file using async I/O
         await progress.update(90, "uploading", "Uploading output file")
-        async with aiofiles.open(local_output, 'rb') as f:
-            content = await f.read()
-            await output_backend.write(output_path, content)
+        await output_backend.write(output_path, iter_file_chunks(local_output))
         
         # Complete
         await progress.update(100, "complete", "Processing complete")
@@ -385,9 +386,7 @@ async def process_streaming_async(job: Job, progress: ProgressTracker) -> Dict[s
     from worker.processors.streaming import StreamingProcessor
     
     # Load storage configuration
-    with open(settings.STORAGE_CONFIG, 'r') as f:
-        import yaml
-        storage_config = yaml.safe_load(f)
+    storage_config = load_storage_config(settings.STORAGE_CONFIG)
     
     # Parse input/output paths
     input_backend_name, input_path = parse_storage_path(job.input_path)
@@ -457,8 +456,7 @@ async def process_streaming_async(job: Job, progress: ProgressTracker) -> Dict[s
             rel_path = Path(file_path).relative_to(streaming_output_dir)
             output_file_path = f"{output_path}/{rel_path}"
             
-            with open(file_path, 'rb') as f:
-                await output_backend.write(output_file_path, f)
+            await output_backend.write(output_file_path, iter_file_chunks(file_path))
             
             uploaded_files.append(output_file_path)
         
@@ -483,4 +481,15 @@ def parse_storage_path(path: str) -> tuple[str, str]:
         parts = path.split("://", 1)
         return parts[0], parts[1]
     # Default to local storage
-    return "local", path
\ No newline at end of file
+    return "local", path
+
+
+async def iter_file_chunks(file_path, chunk_size: int = UPLOAD_CHUNK_SIZE):
+    """Yield a local file's contents in fixed-size chunks for backend uploads."""
+    import aiofiles
+    async with aiofiles.open(file_path, 'rb') as f:
+        while True:
+            chunk = await f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
\ No newline at end of file
@@ -12,6 +12,8 @@ from pathlib import Path
 from typing import Dict, List, Optional, Callable, Any, Tuple
 import structlog
 
+from api.utils.bitrate import BITRATE_REGEX, BITRATE_UNITS
+
 logger = structlog.get_logger()
 
 
@@ -38,9 +40,16 @@ class FFmpegTimeoutError(FFmpegError):
 class HardwareAcceleration:
     """Hardware acceleration detection and management."""
     
-    @staticmethod
-    async def detect_capabilities() -> Dict[str, bool]:
+    # Successful probe result shared by every FFmpegWrapper in the process;
+    # the available encoders don't change while the worker is running.
+    _capabilities_cache: Optional[Dict[str, bool]] = None
+    
+    @classmethod
+    async def detect_capabilities(cls) -> Dict[str, bool]:
         """Detect available hardware acceleration capabilities."""
+        if cls._capabilities_cache is not None:
+            return dict(cls._capabilities_cache)
+        
         capabilities = {
             'nvenc': False,
             'qsv': False,
@@ -59,6 +68,15 @@ class HardwareAcceleration:
             stdout, _ = await result.communicate()
             encoders_output = stdout.decode()
             
+            # A failed or empty probe would mark every encoder unavailable;
+            # report it for this call but probe again next time
+            if result.returncode != 0 or not encoders_output.strip():
+                logger.warning(
+                    "Failed to detect hardware acceleration",
+                    returncode=result.returncode,
+                )
+                return capabilities
+            
             # Check for hardware encoders
             if 'h264_nvenc' in encoders_output:
                 capabilities['nvenc'] = True
@@ -72,6 +90,7 @@ class HardwareAcceleration:
                 capabilities['amf'] = True
                 
             logger.info("Hardware acceleration capabilities detected", capabilities=capabilities)
+            cls._capabilities_cache = dict(capabilities)
             return capabilities
             
         except Exception as e:
@@ -430,18 +449,13 @@ class FFmpegCommandBuilder:
         
         if isinstance(bitrate, str):
             # Parse bitrate strings like "1000k", "5M"
-            import re
-            match = re.match(r'^(\d+)([kKmM]?)$', bitrate)
+            match = BITRATE_REGEX.fullmatch(bitrate)
             if not match:
                 raise FFmpegCommandError(f"Invalid bitrate format: {bitrate}")
             
             value, unit = match.groups()
-            value = int(value)
-            
-            if unit.lower() == 'k':
-                value *= 1000
-            elif unit.lower() == 'm':
-                value *= 1000000
+            multiplier, _ = BITRATE_UNITS[unit.lower()]
+            value = int(value) * multiplier
             
             if value < self.SAFE_RANGES['bitrate_min'] or value > self.SAFE_RANGES['bitrate_max']:
                 raise FFmpegCommandError(f"Bitrate out of safe range: {bitrate}")